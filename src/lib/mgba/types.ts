@@ -16,6 +16,12 @@ export type MemoryChangeListener = (
   data: Uint8Array
 ) => void | Promise<void>
 
+export interface CachedMemoryRegion {
+  address: number
+  size: number
+  data: Uint8Array
+}
+
 // --- WebSocket message schemas ---
 export const WebSocketMemoryUpdateSchema = z.object({
   address: z.number(),
@@ -6,6 +6,7 @@
 import WebSocket from 'isomorphic-ws'
 import {
   WebSocketResponseSchema,
+  type CachedMemoryRegion,
   type SimpleMessage,
   type MemoryChangeListener,
   type WebSocketResponse,
@@ -24,8 +25,8 @@ export class MgbaWebSocketClient {
   private readonly memoryChangeListeners: MemoryChangeListener[] = []
   private watchingMemory = false
 
-  // Memory cache for watched regions
-  private readonly memoryCache = new Map<string, Uint8Array>()
+  // Memory cache for watched regions, keyed by "address-size"
+  private readonly memoryCache = new Map<string, CachedMemoryRegion>()
 
   // Eval request handling
   private readonly pendingEvalHandlers: ((message: SimpleMessage) => boolean)[] = []
@@ -116,7 +117,7 @@ export class MgbaWebSocketClient {
         const { address, size, data } = update
         // Cache the updated memory data
         const cacheKey = `${address}-${size}`
-        this.memoryCache.set(cacheKey, new Uint8Array(data))
+        this.memoryCache.set(cacheKey, { address, size, data: new Uint8Array(data) })
 
         // Notify listeners about memory changes
         for (const listener of this.memoryChangeListeners) {
@@ -246,20 +247,12 @@ export class MgbaWebSocketClient {
    * Check if we can read the requested data from cached memory regions
    */
   private getCachedMemory(address: number, size: number): Uint8Array | null {
-    for (const [cacheKey, watchedData] of this.memoryCache.entries()) {
-      const [watchedAddressStr, watchedSizeStr] = cacheKey.split('-')
-      const watchedAddress = Number(watchedAddressStr)
-      const watchedSize = Number(watchedSizeStr)
-      if (
-        Number.isNaN(watchedAddress) ||
-        Number.isNaN(watchedSize) ||
-        address < watchedAddress ||
-        address + size > watchedAddress + watchedSize
-      ) {
+    for (const { address: watchedAddress, size: watchedSize, data } of this.memoryCache.values()) {
+      if (address < watchedAddress || address + size > watchedAddress + watchedSize) {
         continue
       }
       const start = address - watchedAddress
-      return watchedData.slice(start, start + size)
+      return data.slice(start, start + size)
     }
     return null
   }
@@ -7,7 +7,7 @@ import { beforeAll, describe, expect, it } from 'vitest'
 import { PokemonSaveParser } from '../core/PokemonSaveParser'
 import { QuetzalConfig } from '../games/quetzal/config'
 import { VanillaConfig } from '../games/vanilla/config'
-import { bytesToGbaString } from '../core/utils'
+import { bytesToGbaString, decodePokemonText } from '../core/utils'
 
 describe('Pokemon Save Parser - Unit Tests', () => {
   let quetzalConfig: QuetzalConfig
@@ -200,6 +200,19 @@ describe('Pokemon Save Parser - Unit Tests', () => {
       const withGarbage = new Uint8Array([187, 188, 0xff, 0x05, 0x02])
       expect(bytesToGbaString(withGarbage)).toBe('AB')
     })
+
+    it('should decode 0xFF-terminated text such as the player name', () => {
+      // Stops at the first 0xFF, ignoring anything after it
+      const playerName = new Uint8Array([187, 188, 189, 0xff, 0x05, 0x02, 0x00, 0x00])
+      expect(decodePokemonText(playerName)).toBe('ABC')
+
+      // Uses the full buffer when there is no terminator
+      const noTermination = new Uint8Array([187, 188, 189, 190])
+      expect(decodePokemonText(noTermination)).toBe('ABCD')
+
+      // Empty when the first byte is the terminator
+      expect(decodePokemonText(new Uint8Array([0xff, 187, 188]))).toBe('')
+    })
   })
 
   describe('Config-Specific Functionality', () => {
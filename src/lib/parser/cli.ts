@@ -248,34 +248,41 @@ async function watchModeFile(
 
   // Create parser once and reuse it
   const parser = new PokemonSaveParser()
+  const absPath = path.resolve(filePath)
   let lastDataHash = ''
+  let lastFileStamp = ''
   let isFirstRun = true
 
   // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
   while (true) {
     try {
-      // Parse save data without re-initializing parser
-      const absPath = path.resolve(filePath)
-      const buffer = fs.readFileSync(absPath)
-      const result = await parser.parse(buffer)
-
-      // Create a simple hash of the party data to detect changes
-      const dataHash = JSON.stringify(
-        result.party_pokemon.map(p => ({
-          species: p.speciesId,
-          level: p.level,
-          hp: p.currentHp,
-          nickname: p.nickname,
-        }))
-      )
-
-      // Only update display if party data changed or first run
-      if (dataHash !== lastDataHash || isFirstRun) {
-        clearScreen()
-        displayPartyPokemon(result.party_pokemon, 'FILE')
-
-        lastDataHash = dataHash
-        isFirstRun = false
+      // Skip reading and parsing the file when it has not changed since the last poll
+      const { mtimeMs, size } = fs.statSync(absPath)
+      const fileStamp = `${mtimeMs}:${size}`
+      if (fileStamp !== lastFileStamp) {
+        // Parse save data without re-initializing parser
+        const buffer = fs.readFileSync(absPath)
+        const result = await parser.parse(buffer)
+
+        // Create a simple hash of the party data to detect changes
+        const dataHash = JSON.stringify(
+          result.party_pokemon.map(p => ({
+            species: p.speciesId,
+            level: p.level,
+            hp: p.currentHp,
+            nickname: p.nickname,
+          }))
+        )
+
+        // Only update display if party data changed or first run
+        if (dataHash !== lastDataHash || isFirstRun) {
+          clearScreen()
+          displayPartyPokemon(result.party_pokemon, 'FILE')
+
+          lastDataHash = dataHash
+          isFirstRun = false
+        }
+        lastFileStamp = fileStamp
       }
     } catch (error) {
       console.error('❌ Error:', error instanceof Error ? error.message : 'Unknown error')
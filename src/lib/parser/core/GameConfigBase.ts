@@ -22,20 +22,20 @@ export abstract class GameConfigBase {
       }
 
       // Look for valid Emerald signature in sector footers
+      // Need at least 8 valid sectors to be confident, so stop as soon as they are found
       let validSectors = 0
       for (let i = 0; i < 32; i++) {
         const footerOffset = i * 4096 + 4096 - 12
         if (footerOffset + 12 <= saveData.length) {
           const view = new DataView(saveData.buffer, saveData.byteOffset + footerOffset, 12)
           const signature = view.getUint32(4, true)
-          if (signature === expectedSignature) {
-            validSectors++
+          if (signature === expectedSignature && ++validSectors >= 8) {
+            return true
           }
         }
       }
 
-      // Need at least 8 valid sectors to be confident
-      return validSectors >= 8
+      return false
     } catch {
       return false
     }
@@ -80,9 +80,9 @@ export abstract class GameConfigBase {
     for (const sectorId of saveblock1Sectors) {
       const sectorIdx = sectorMap.get(sectorId)!
       const startOffset = sectorIdx * 4096
-      const sectorData = saveData.slice(startOffset, startOffset + 3968)
+      const sectorData = saveData.subarray(startOffset, startOffset + 3968)
       const chunkOffset = (sectorId - 1) * 3968
-      saveblock1Data.set(sectorData.slice(0, 3968), chunkOffset)
+      saveblock1Data.set(sectorData, chunkOffset)
     }
 
     return saveblock1Data
@@ -145,7 +145,7 @@ export abstract class GameConfigBase {
 
     for (let slot = 0; slot < 6; slot++) {
       const offset = 0x6a8 + slot * pokemonSize
-      const data = saveblock1Data.slice(offset, offset + pokemonSize)
+      const data = saveblock1Data.subarray(offset, offset + pokemonSize)
 
       if (!this.validatePokemonData(data, pokemonSize)) {
         break
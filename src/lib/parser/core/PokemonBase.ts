@@ -12,6 +12,36 @@ import {
 } from './types'
 import { bytesToGbaString, natureEffects, natures, statStrings } from './utils'
 
+/**
+ * Gen 3 substruct orderings indexed by personality % 24
+ */
+const SUBSTRUCT_ORDERS: readonly (readonly number[])[] = [
+  [0, 1, 2, 3],
+  [0, 1, 3, 2],
+  [0, 2, 1, 3],
+  [0, 3, 1, 2],
+  [0, 2, 3, 1],
+  [0, 3, 2, 1],
+  [1, 0, 2, 3],
+  [1, 0, 3, 2],
+  [2, 0, 1, 3],
+  [3, 0, 1, 2],
+  [2, 0, 3, 1],
+  [3, 0, 2, 1],
+  [1, 2, 0, 3],
+  [1, 3, 0, 2],
+  [2, 1, 0, 3],
+  [3, 1, 0, 2],
+  [2, 3, 0, 1],
+  [3, 2, 0, 1],
+  [1, 2, 3, 0],
+  [1, 3, 2, 0],
+  [2, 1, 3, 0],
+  [3, 1, 2, 0],
+  [2, 3, 1, 0],
+  [3, 2, 1, 0],
+]
+
 /**
  * Pokemon data class with vanilla Pokemon Emerald as the baseline
  * Game configs provide minimal overrides for different games
@@ -116,34 +146,8 @@ export class PokemonBase {
     return personality ^ otId
   }
 
-  protected getSubstructOrder(personality: number): number[] {
-    const orderTable = [
-      [0, 1, 2, 3],
-      [0, 1, 3, 2],
-      [0, 2, 1, 3],
-      [0, 3, 1, 2],
-      [0, 2, 3, 1],
-      [0, 3, 2, 1],
-      [1, 0, 2, 3],
-      [1, 0, 3, 2],
-      [2, 0, 1, 3],
-      [3, 0, 1, 2],
-      [2, 0, 3, 1],
-      [3, 0, 2, 1],
-      [1, 2, 0, 3],
-      [1, 3, 0, 2],
-      [2, 1, 0, 3],
-      [3, 1, 0, 2],
-      [2, 3, 0, 1],
-      [3, 2, 0, 1],
-      [1, 2, 3, 0],
-      [1, 3, 2, 0],
-      [2, 1, 3, 0],
-      [3, 1, 2, 0],
-      [2, 3, 1, 0],
-      [3, 2, 1, 0],
-    ]
-    return orderTable[personality % 24]!
+  protected getSubstructOrder(personality: number): readonly number[] {
+    return SUBSTRUCT_ORDERS[personality % 24]!
   }
 
   protected setEncryptedSubstruct(substructIndex: number, decryptedData: Uint8Array): void {
@@ -157,16 +161,11 @@ export class PokemonBase {
       throw new Error(`Substruct data must be 12 bytes, got ${decryptedData.length}`)
     }
 
-    // Encrypt the data
+    // Encrypt the data word by word, writing back to the original location
     const key = this.getEncryptionKey(this.data)
+    const decView = new DataView(decryptedData.buffer, decryptedData.byteOffset, 12)
     for (let i = 0; i < 12; i += 4) {
-      const decView = new DataView(decryptedData.buffer, decryptedData.byteOffset + i, 4)
-      const decrypted = decView.getUint32(0, true)
-      const encrypted = decrypted ^ key
-
-      // Write encrypted data back to original location
-      const origView = new DataView(this.data.buffer, this.data.byteOffset + substructOffset + i, 4)
-      origView.setUint32(0, encrypted, true)
+      view.setUint32(substructOffset + i, decView.getUint32(i, true) ^ key, true)
     }
   }
 
@@ -176,17 +175,12 @@ export class PokemonBase {
     const order = this.getSubstructOrder(personality)
     const actualIndex = order[substructIndex]!
     const substructOffset = 0x20 + actualIndex * 12
-    const encryptedData = new Uint8Array(data.buffer, data.byteOffset + substructOffset, 12)
     const decryptedData = new Uint8Array(12)
+    const decView = new DataView(decryptedData.buffer)
 
     const key = this.getEncryptionKey(data)
     for (let i = 0; i < 12; i += 4) {
-      const encView = new DataView(encryptedData.buffer, encryptedData.byteOffset + i, 4)
-      const encrypted = encView.getUint32(0, true)
-      const decrypted = encrypted ^ key
-
-      const decView = new DataView(decryptedData.buffer, i, 4)
-      decView.setUint32(0, decrypted, true)
+      decView.setUint32(i, view.getUint32(substructOffset + i, true) ^ key, true)
     }
 
     return decryptedData
@@ -671,7 +665,11 @@ export class PokemonBase {
   }
 
   get evs(): readonly number[] {
-    return [this.hpEV, this.atkEV, this.defEV, this.speEV, this.spaEV, this.spdEV]
+    if (this.config.getEV) {
+      return [this.hpEV, this.atkEV, this.defEV, this.speEV, this.spaEV, this.spdEV]
+    }
+    // Vanilla: EVs are bytes 0-5 of decrypted substruct 2
+    return Array.from(this.getDecryptedSubstruct(this.data, 2).subarray(0, 6))
   }
 
   set evs(values: readonly number[]) {
@@ -697,7 +695,9 @@ export class PokemonBase {
   }
 
   get ppValues(): readonly number[] {
-    return [this.pp1, this.pp2, this.pp3, this.pp4]
+    if (this.config.getPP) return [this.pp1, this.pp2, this.pp3, this.pp4]
+    // Vanilla: PP values are bytes 8-11 of decrypted substruct 1
+    return Array.from(this.getDecryptedSubstruct(this.data, 1).subarray(8, 12))
   }
 
   setEvByIndex(statIndex: number, value: number): void {
@@ -14,30 +14,7 @@ import {
 import { MgbaWebSocketClient } from '../../mgba/websocket-client'
 import { GameConfigRegistry } from '../games'
 import { PokemonBase } from './PokemonBase'
-
-// Import character map for decoding text
-import charMap from '../data/pokemon_charmap.json'
-
-/**
- * Decode Pokemon character-encoded text to string
- */
-function decodePokemonText(bytes: Uint8Array): string {
-  const result: string[] = []
-
-  for (const byte of bytes) {
-    if (byte === 0xff) {
-      // End of string marker
-      break
-    }
-
-    const char = charMap[byte.toString() as keyof typeof charMap]
-    if (char) {
-      result.push(char)
-    }
-  }
-
-  return result.join('').trim()
-}
+import { decodePokemonText } from './utils'
 
 /**
  * Main Pokemon Save File Parser class
@@ -48,6 +25,7 @@ export class PokemonSaveParser {
   private saveData: Uint8Array | null = null
   private activeSlotStart = 0
   private readonly sectorMap = new Map<number, number>()
+  private readonly sectorInfoCache = new Map<number, SectorInfo>()
   private readonly forcedSlot: 1 | 2 | undefined
   private config: GameConfig | null = null
   public saveFileName: string | null = null
@@ -84,6 +62,7 @@ export class PokemonSaveParser {
     try {
       // Always clear sectorMap before loading new data to avoid stale state
       this.sectorMap.clear()
+      this.sectorInfoCache.clear()
 
       // Check if input is a WebSocket client for memory mode using proper instanceof check
       if (input instanceof MgbaWebSocketClient) {
@@ -182,8 +161,21 @@ export class PokemonSaveParser {
 
   /**
    * Get information about a specific sector
+   * Results are cached per load so slot detection and sector mapping share a single pass
    */
   private getSectorInfo(sectorIndex: number): SectorInfo {
+    let info = this.sectorInfoCache.get(sectorIndex)
+    if (!info) {
+      info = this.readSectorInfo(sectorIndex)
+      this.sectorInfoCache.set(sectorIndex, info)
+    }
+    return info
+  }
+
+  /**
+   * Read and validate the footer of a specific sector
+   */
+  private readSectorInfo(sectorIndex: number): SectorInfo {
     if (!this.saveData || !this.config) {
       throw new Error('Save data and config not loaded')
     }
@@ -208,7 +200,7 @@ export class PokemonSaveParser {
       }
 
       const sectorStart = sectorIndex * this.config.saveLayout.sectorSize
-      const sectorData = this.saveData.slice(
+      const sectorData = this.saveData.subarray(
         sectorStart,
         sectorStart + this.config.saveLayout.sectorDataSize
       )
@@ -307,13 +299,13 @@ export class PokemonSaveParser {
     for (const sectorId of saveblock1Sectors) {
       const sectorIdx = this.sectorMap.get(sectorId)!
       const startOffset = sectorIdx * this.config.saveLayout.sectorSize
-      const sectorData = this.saveData.slice(
+      const sectorData = this.saveData.subarray(
         startOffset,
         startOffset + this.config.saveLayout.sectorDataSize
       )
       const chunkOffset = (sectorId - 1) * this.config.saveLayout.sectorDataSize
 
-      saveblock1Data.set(sectorData.slice(0, this.config.saveLayout.sectorDataSize), chunkOffset)
+      saveblock1Data.set(sectorData, chunkOffset)
     }
 
     return saveblock1Data
@@ -452,22 +444,18 @@ export class PokemonSaveParser {
       throw new Error('Config not loaded')
     }
 
-    if (sectorData.length < this.config.saveLayout.sectorDataSize) {
+    const { sectorDataSize } = this.config.saveLayout
+    if (sectorData.length < sectorDataSize) {
       return 0
     }
 
     let checksum = 0
     const view = new DataView(sectorData.buffer, sectorData.byteOffset)
+    // Bounds are checked once up front: every word read below fits inside sectorData
+    const end = Math.min(sectorDataSize, sectorData.length - 3)
 
-    for (let i = 0; i < this.config.saveLayout.sectorDataSize; i += 4) {
-      if (i + 4 <= sectorData.length) {
-        try {
-          const value = view.getUint32(i, true)
-          checksum += value
-        } catch {
-          break
-        }
-      }
+    for (let i = 0; i < end; i += 4) {
+      checksum += view.getUint32(i, true)
     }
 
     return ((checksum >>> 16) + (checksum & 0xffff)) & 0xffff
@@ -559,6 +547,7 @@ export class PokemonSaveParser {
    */
   setGameConfig(config: GameConfig): void {
     this.config = config
+    this.sectorInfoCache.clear()
   }
 
   /**
@@ -6,10 +6,19 @@
 import type { PokemonBase } from './PokemonBase'
 import charmapData from '../data/pokemon_charmap.json'
 
-// Convert charmap keys from strings to numbers for faster lookup
-const charmap: Record<number, string> = {}
-for (const [key, value] of Object.entries(charmapData)) {
-  charmap[parseInt(key, 10)] = value
+/**
+ * Dense byte -> character lookup table for Pokemon GBA text
+ * Indexed directly by byte value (0x00-0xFF); unmapped bytes are undefined
+ */
+const charmap: readonly (string | undefined)[] = Array.from(
+  { length: 256 },
+  (_, byte) => (charmapData as Record<string, string>)[byte]
+)
+
+// Reverse charmap (char -> byte) for encoding
+const reverseCharmap: Record<string, number> = {}
+for (const [byte, value] of charmap.entries()) {
+  if (value !== undefined) reverseCharmap[value] = byte
 }
 
 /**
@@ -43,6 +52,25 @@ export function bytesToGbaString(bytes: Uint8Array): string {
   return result.trim()
 }
 
+/**
+ * Decode Pokemon character-encoded text up to the first 0xFF terminator
+ * Unlike bytesToGbaString, no padding/garbage detection or control code handling is applied
+ */
+export function decodePokemonText(bytes: Uint8Array): string {
+  const result: string[] = []
+
+  // 0xFF is the end of string marker
+  const end = bytes.indexOf(0xff)
+  for (const byte of end === -1 ? bytes : bytes.subarray(0, end)) {
+    const char = charmap[byte]
+    if (char) {
+      result.push(char)
+    }
+  }
+
+  return result.join('').trim()
+}
+
 /**
  * Find the actual end of a Pokemon GBA string by detecting padding patterns
  */
@@ -58,13 +86,15 @@ function findStringEnd(bytes: Uint8Array): number {
   }
 
   // Look for garbage pattern: 0xFF followed by low values (0x01-0x0F)
-  for (let i = 0; i < bytes.length - 1; i++) {
-    if (bytes[i] === 0xff) {
-      for (let j = i + 1; j < bytes.length; j++) {
-        const nextByte = bytes[j]!
-        if (nextByte > 0 && nextByte < 0x10) return i // Found garbage
-        if (nextByte !== 0xff && nextByte !== 0) break
-      }
+  for (
+    let i = bytes.indexOf(0xff);
+    i !== -1 && i < bytes.length - 1;
+    i = bytes.indexOf(0xff, i + 1)
+  ) {
+    for (let j = i + 1; j < bytes.length; j++) {
+      const nextByte = bytes[j]!
+      if (nextByte > 0 && nextByte < 0x10) return i // Found garbage
+      if (nextByte !== 0xff && nextByte !== 0) break
     }
   }
 
@@ -80,11 +110,6 @@ function findStringEnd(bytes: Uint8Array): number {
  * @returns Uint8Array of encoded bytes
  */
 export function gbaStringToBytes(str: string, length = 10): Uint8Array {
-  // Build a reverse charmap: char -> byte
-  const reverseCharmap: Record<string, number> = {}
-  for (const [key, value] of Object.entries(charmap)) {
-    reverseCharmap[value] = Number(key)
-  }
   const bytes = new Uint8Array(length).fill(0xff)
   let i = 0
   for (const char of str) {
@@ -109,6 +109,30 @@ export class QuetzalConfig extends GameConfigBase implements GameConfig {
     ivData: 0x50,
   } as const
 
+  // Per-index offset tables for moves, PP and EVs
+  private readonly moveOffsets = [
+    this.quetzalOffsets.move1,
+    this.quetzalOffsets.move2,
+    this.quetzalOffsets.move3,
+    this.quetzalOffsets.move4,
+  ] as const
+
+  private readonly ppOffsets = [
+    this.quetzalOffsets.pp1,
+    this.quetzalOffsets.pp2,
+    this.quetzalOffsets.pp3,
+    this.quetzalOffsets.pp4,
+  ] as const
+
+  private readonly evOffsets = [
+    this.quetzalOffsets.hpEV,
+    this.quetzalOffsets.atkEV,
+    this.quetzalOffsets.defEV,
+    this.quetzalOffsets.speEV,
+    this.quetzalOffsets.spaEV,
+    this.quetzalOffsets.spdEV,
+  ] as const
+
   // Override data access methods for Quetzal's unencrypted structure
   getSpeciesId(_data: Uint8Array, view: DataView): number {
     const rawSpecies = view.getUint16(this.quetzalOffsets.species, true)
@@ -147,50 +171,22 @@ export class QuetzalConfig extends GameConfigBase implements GameConfig {
   }
 
   getMove(_data: Uint8Array, view: DataView, index: number): number {
-    const moveOffsets = [
-      this.quetzalOffsets.move1,
-      this.quetzalOffsets.move2,
-      this.quetzalOffsets.move3,
-      this.quetzalOffsets.move4,
-    ]
-    const rawMove = view.getUint16(moveOffsets[index]!, true)
+    const rawMove = view.getUint16(this.moveOffsets[index]!, true)
     // Apply ID mapping using the base mapping system
     return this.mappings.moves.get(rawMove)?.id ?? rawMove
   }
 
   getPP(_data: Uint8Array, view: DataView, index: number): number {
-    const ppOffsets = [
-      this.quetzalOffsets.pp1,
-      this.quetzalOffsets.pp2,
-      this.quetzalOffsets.pp3,
-      this.quetzalOffsets.pp4,
-    ]
-    return view.getUint8(ppOffsets[index]!)
+    return view.getUint8(this.ppOffsets[index]!)
   }
 
   getEV(_data: Uint8Array, view: DataView, index: number): number {
-    const evOffsets = [
-      this.quetzalOffsets.hpEV,
-      this.quetzalOffsets.atkEV,
-      this.quetzalOffsets.defEV,
-      this.quetzalOffsets.speEV,
-      this.quetzalOffsets.spaEV,
-      this.quetzalOffsets.spdEV,
-    ]
-    return view.getUint8(evOffsets[index]!)
+    return view.getUint8(this.evOffsets[index]!)
   }
 
   setEV(_data: Uint8Array, view: DataView, index: number, value: number): void {
-    const evOffsets = [
-      this.quetzalOffsets.hpEV,
-      this.quetzalOffsets.atkEV,
-      this.quetzalOffsets.defEV,
-      this.quetzalOffsets.speEV,
-      this.quetzalOffsets.spaEV,
-      this.quetzalOffsets.spdEV,
-    ]
     const clampedValue = Math.max(0, Math.min(255, value))
-    view.setUint8(evOffsets[index]!, clampedValue)
+    view.setUint8(this.evOffsets[index]!, clampedValue)
   }
 
   getIVs(_data: Uint8Array, view: DataView): readonly number[] {